@@ -3,96 +3,58 @@
 Web interface for Meeting Action Item Extractor
 """
 
-from flask import Flask, render_template_string, request, jsonify
-from extract_actions import extract_action_items
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import JSONProvider
+from extract_actions import (extract_action_items, extract_action_items_batch, stream_action_items,
+                             json_dumps, json_loads, OLLAMA_DEFAULT_MODEL)
+import gzip
+import hashlib
+import html
+import json
 import os
 
-app = Flask(__name__)
+class FastJSONProvider(JSONProvider):
+    """JSON provider for jsonify() and request.json backed by orjson (when installed)."""
+    
+    def dumps(self, obj, **kwargs) -> str:
+        if kwargs:
+            # orjson has no equivalent for options like sort_keys or a custom indent
+            return json.dumps(obj, **kwargs)
+        return json_dumps(obj).decode()
+    
+    def loads(self, s, **kwargs):
+        return json_loads(s)
+    
+    def response(self, *args, **kwargs) -> Response:
+        # Same arguments as jsonify(): one value, several (a list), or keywords (a dict)
+        if args and kwargs:
+            raise TypeError("jsonify() behavior undefined when passed both args and kwargs")
+        if kwargs:
+            obj = kwargs
+        elif len(args) == 1:
+            obj = args[0]
+        else:
+            obj = list(args) or None
+        return self._app.response_class(json_dumps(obj), mimetype="application/json")
+
+app = Flask(__name__, static_folder="static")
+app.json = FastJSONProvider(app)
+
+# Environment is fixed for the life of the worker; read it once, not per request
+_OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+_OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", OLLAMA_DEFAULT_MODEL)
+
+def _provider_kwargs(provider: str) -> dict:
+    if provider == "ollama":
+        return {"base_url": _OLLAMA_BASE_URL, "model": _OLLAMA_MODEL}
+    return {}
 
 HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html>
 <head>
     <title>Meeting Action Item Extractor</title>
-    <style>
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            background: #f5f5f5;
-        }
-        .container {
-            background: white;
-            padding: 30px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        h1 {
-            color: #333;
-            margin-bottom: 30px;
-        }
-        textarea {
-            width: 100%;
-            min-height: 200px;
-            padding: 12px;
-            border: 1px solid #ddd;
-            border-radius: 4px;
-            font-family: monospace;
-            font-size: 14px;
-            box-sizing: border-box;
-        }
-        .controls {
-            margin: 20px 0;
-            display: flex;
-            gap: 10px;
-            align-items: center;
-        }
-        select, button {
-            padding: 10px 20px;
-            border: 1px solid #ddd;
-            border-radius: 4px;
-            font-size: 14px;
-        }
-        button {
-            background: #007bff;
-            color: white;
-            border: none;
-            cursor: pointer;
-        }
-        button:hover {
-            background: #0056b3;
-        }
-        .results {
-            margin-top: 30px;
-        }
-        table {
-            width: 100%;
-            border-collapse: collapse;
-            margin-top: 20px;
-        }
-        th, td {
-            padding: 12px;
-            text-align: left;
-            border-bottom: 1px solid #ddd;
-        }
-        th {
-            background: #f8f9fa;
-            font-weight: 600;
-        }
-        .loading {
-            display: none;
-            text-align: center;
-            padding: 20px;
-        }
-        .error {
-            color: #dc3545;
-            padding: 10px;
-            background: #f8d7da;
-            border-radius: 4px;
-            margin-top: 10px;
-        }
-    </style>
+    <link rel="stylesheet" href="/static/style.css?v={asset_version}">
 </head>
 <body>
     <div class="container">
@@ -120,71 +82,63 @@ HTML_TEMPLATE = """
         <div class="results" id="results"></div>
     </div>
     
-    <script>
-        document.getElementById('extractForm').addEventListener('submit', async (e) => {
-            e.preventDefault();
-            
-            const notes = document.getElementById('notes').value;
-            const provider = document.getElementById('provider').value;
-            const loading = document.getElementById('loading');
-            const error = document.getElementById('error');
-            const results = document.getElementById('results');
-            
-            loading.style.display = 'block';
-            error.innerHTML = '';
-            results.innerHTML = '';
-            
-            try {
-                const response = await fetch('/extract', {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                    },
-                    body: JSON.stringify({ notes, provider })
-                });
-                
-                const data = await response.json();
-                
-                if (data.error) {
-                    error.innerHTML = `<div class="error">${data.error}</div>`;
-                } else {
-                    displayResults(data.actions);
-                }
-            } catch (err) {
-                error.innerHTML = `<div class="error">Error: ${err.message}</div>`;
-            } finally {
-                loading.style.display = 'none';
-            }
-        });
-        
-        function displayResults(actions) {
-            if (actions.length === 0) {
-                document.getElementById('results').innerHTML = '<p>No action items found.</p>';
-                return;
-            }
-            
-            let html = '<h2>Extracted Action Items</h2><table><thead><tr><th>Assignee</th><th>Task</th><th>Due Date</th><th>Priority</th></tr></thead><tbody>';
-            
-            actions.forEach(action => {
-                html += `<tr>
-                    <td>${action.assignee || 'Unassigned'}</td>
-                    <td>${action.task || 'N/A'}</td>
-                    <td>${action.due_date || 'Not specified'}</td>
-                    <td>${action.priority || 'medium'}</td>
-                </tr>`;
-            });
-            
-            html += '</tbody></table>';
-            document.getElementById('results').innerHTML = html;
-        }
-    </script>
+    <script src="/static/app.js?v={asset_version}"></script>
 </body>
 </html>
 """
 
+# CSS and JS are cached by browsers for a year; the ?v= in their URLs is a
+# digest of their contents, so any change is fetched under a new URL
+_STATIC_ASSETS = ("style.css", "app.js")
+_STATIC_IMMUTABLE = "public, max-age=31536000, immutable"
+
+def _read_static(filename: str) -> bytes:
+    with open(os.path.join(app.static_folder, filename), "rb") as f:
+        return f.read()
+
+_STATIC_GZIP = {name: gzip.compress(_read_static(name)) for name in _STATIC_ASSETS}
+_ASSET_VERSION = hashlib.blake2b(b"".join(_read_static(name) for name in _STATIC_ASSETS),
+                                 digest_size=6).hexdigest()
+
+@app.after_request
+def cache_static_assets(response):
+    if request.endpoint != "static" or response.status_code != 200:
+        return response
+    
+    if request.args.get("v") == _ASSET_VERSION:
+        response.headers["Cache-Control"] = _STATIC_IMMUTABLE
+    
+    compressed = _STATIC_GZIP.get(request.view_args.get("filename"))
+    if compressed is not None:
+        response.vary.add("Accept-Encoding")
+        if request.accept_encodings.quality("gzip") > 0:
+            # Release the file send_file opened before swapping in the gzip body
+            response.close()
+            response.direct_passthrough = False
+            response.set_data(compressed)
+            response.headers["Content-Encoding"] = "gzip"
+            response.headers.pop("Accept-Ranges", None)
+            etag, weak = response.get_etag()
+            if etag:
+                response.set_etag(etag + "-gzip", weak)
+                # send_file compared If-None-Match against the uncompressed ETag
+                response.make_conditional(request)
+    return response
+
+# The page is static apart from the asset version, so it is encoded and
+# compressed once here rather than rendered on every request
+_INDEX_HTML = HTML_TEMPLATE.format(asset_version=_ASSET_VERSION).encode()
+_INDEX_HTML_GZIP = gzip.compress(_INDEX_HTML)
+
 @app.route("/")
 def index():
-    return render_template_string(HTML_TEMPLATE)
+    if request.accept_encodings.quality("gzip") > 0:
+        response = Response(_INDEX_HTML_GZIP, mimetype="text/html")
+        response.headers["Content-Encoding"] = "gzip"
+    else:
+        response = Response(_INDEX_HTML, mimetype="text/html")
+    response.vary.add("Accept-Encoding")
+    return response
 
 @app.route("/extract", methods=["POST"])
 def extract():
@@ -196,16 +150,82 @@ def extract():
         if not notes:
             return jsonify({"error": "No notes provided"}), 400
         
-        kwargs = {}
-        if provider == "ollama":
-            kwargs["base_url"] = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
-            kwargs["model"] = os.getenv("OLLAMA_MODEL", "llama2")
-        
-        actions = extract_action_items(notes, provider=provider, **kwargs)
+        actions = extract_action_items(notes, provider=provider, **_provider_kwargs(provider))
         
         return jsonify({"actions": actions})
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
-if __name__ == "__main__":
-    app.run(debug=True, port=5000)
+_ROW_TEMPLATE = "<tr><td>{}</td><td>{}</td><td>{}</td><td>{}</td></tr>"
+
+def render_rows(actions) -> str:
+    """Render actions as escaped <tr> rows for the results table."""
+    rows = []
+    for action in actions:
+        if not isinstance(action, dict):
+            action = {}
+        rows.append(_ROW_TEMPLATE.format(
+            html.escape(str(action.get("assignee") or "Unassigned")),
+            html.escape(str(action.get("task") or "N/A")),
+            html.escape(str(action.get("due_date") or "Not specified")),
+            html.escape(str(action.get("priority") or "medium"))
+        ))
+    return "".join(rows)
+
+@app.route("/extract_html", methods=["POST"])
+def extract_html():
+    try:
+        data = request.json
+        notes = data.get("notes", "")
+        provider = data.get("provider", "regex")
+        
+        if not notes:
+            return jsonify({"error": "No notes provided"}), 400
+        
+        actions = extract_action_items(notes, provider=provider, **_provider_kwargs(provider))
+        
+        return Response(render_rows(actions), mimetype="text/html")
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route("/extract_stream", methods=["POST"])
+def extract_stream():
+    try:
+        data = request.json
+        notes = data.get("notes", "")
+        provider = data.get("provider", "regex")
+        
+        if not notes:
+            return jsonify({"error": "No notes provided"}), 400
+        
+        actions = stream_action_items(notes, provider=provider, **_provider_kwargs(provider))
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+    
+    def generate():
+        try:
+            for action in actions:
+                yield f"data: {app.json.dumps(action)}\n\n"
+            yield "event: done\ndata: {}\n\n"
+        except Exception as e:
+            yield f"event: error\ndata: {app.json.dumps({'error': str(e)})}\n\n"
+    
+    return Response(generate(), mimetype="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+@app.route("/extract_batch", methods=["POST"])
+def extract_batch():
+    try:
+        data = request.json
+        notes = data.get("notes", [])
+        provider = data.get("provider", "regex")
+        
+        if not isinstance(notes, list) or not all(isinstance(n, str) for n in notes):
+            return jsonify({"error": "notes must be a list of strings"}), 400
+        if not notes:
+            return jsonify({"error": "No notes provided"}), 400
+        
+        results = extract_action_items_batch(notes, provider=provider, **_provider_kwargs(provider))
+        
+        return jsonify({"results": results})
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
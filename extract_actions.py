@@ -9,23 +9,54 @@ Supports multiple extraction methods: LLM (OpenAI/Ollama) and rule-based.
 import re
 import json
 import argparse
+import asyncio
+import csv
+import hashlib
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, NamedTuple, Optional, Tuple
 from pathlib import Path
 
 try:
-    from openai import OpenAI
+    from openai import OpenAI, AsyncOpenAI
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     from dotenv import load_dotenv
     load_dotenv()
@@ -33,137 +64,761 @@ except ImportError:
     pass
 
 
+def json_dumps(obj, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+        except orjson.JSONEncodeError:
+            # e.g. lone surrogates from malformed input, which json can still escape
+            pass
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+def json_loads(data):
+    """Parse JSON from str or bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (e.g. about escaped lone surrogates); let json decide
+            pass
+    return json.loads(data)
+
+
+def _compile_action_pattern(pattern: str, re2_pattern: str):
+    """
+    Compile an action pattern, preferring google-re2 when it is installed.
+
+    The patterns pair lazy `.+?` with alternations, which `re` resolves by
+    backtracking; RE2 compiles them to an automaton instead, so matching
+    stays linear in the length of the notes. The match API is compatible,
+    and anything RE2 rejects falls back to `re` at import time.
+    
+    RE2's \w, \s, \d and \b only match ASCII, so it gets re2_pattern, the
+    same pattern spelled with Unicode classes.
+    """
+    if RE2_AVAILABLE:
+        try:
+            return re2.compile('(?m)' + re2_pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern, re.MULTILINE)
+
+
+_DUE_KEYWORDS = ('by', 'before', 'until', 'due')
+
+_URGENT_KEYWORDS = ('urgent', 'asap', 'critical', 'blocker', 'p0', 'p1')
+
+
+class _Classes(NamedTuple):
+    """How an engine spells the character classes the action patterns use."""
+    ws: str      # whitespace within a line
+    word: str
+    digit: str
+
+
+_RE_CLASSES = _Classes(r'[^\S\n]', r'\w', r'\d')
+
+# Python's str.isspace() set minus "\n"
+_RE2_CLASSES = _Classes('[\t\x0b\x0c\r\x1c-\x1f\x85\u2028\u2029\\p{Zs}]', r'[\pL\pN_]', r'\p{Nd}')
+
+
+def _action_branches(c: _Classes) -> Tuple[str, str, str, str]:
+    """
+    Build the mention, name, task-list and urgency patterns.
+    
+    Whitespace is matched within a line only: action items live on one line,
+    and with `.` not matching "\n" either, no match can span a line break, so
+    the notes can be scanned in independent line-aligned chunks.
+    """
+    # Trailing deadline clause shared by every action pattern
+    def due(group: str) -> str:
+        return (r'(?:' + '|'.join(_DUE_KEYWORDS) + rf'){c.ws}+(?P<{group}>{c.word}+{c.ws}*{c.digit}*,?{c.ws}*{c.digit}*'
+                rf'|today|tomorrow|next{c.ws}+{c.word}+|friday|monday|etc\.?)')
+    
+    # Optional list bullet, so "- @sarah to ..." is claimed by the mention/name branch
+    bullet = rf'(?:[-•*]{c.ws}*)?'
+    
+    # @mentions with tasks
+    mention = bullet + rf'@(?P<m_user>{c.word}+){c.ws}+(?:to|will|should){c.ws}+(?P<m_task>.+?)' + due('m_date')
+    
+    # Names followed by tasks
+    name = (bullet + rf'@?(?P<n_name>[a-z][a-z]+(?:{c.ws}+[a-z][a-z]+)?){c.ws}+(?:will|should|to){c.ws}+'
+            rf'(?P<n_task>.+?)' + due('n_date'))
+    
+    # Simple task lists
+    task = rf'[-•*]{c.ws}*(?P<t_task>.+?)' + due('t_date')
+    
+    # Urgency hints; they raise the priority of the action on the same line
+    # (RE2 has no lookaround to spell a Unicode \b, so its ASCII one is used
+    # and extract_with_regex checks the neighbouring characters)
+    urgent = r'\b(?P<urgent>' + '|'.join(_URGENT_KEYWORDS) + r')\b'
+    
+    return mention, name, task, urgent
+
+
+def _alternation(patterns) -> str:
+    return '|'.join(f'(?:{p})' for p in patterns)
+
+
+_BRANCH_PATTERNS = _action_branches(_RE_CLASSES)
+_RE2_BRANCH_PATTERNS = _action_branches(_RE2_CLASSES)
+
+_URGENT_RE = re.compile(_BRANCH_PATTERNS[3], re.IGNORECASE)
+
+_DEFAULT_PRIORITY = "medium"
+_URGENT_PRIORITY = "high"
+
+# All four in one alternation, compiled once at import: a single scan over
+# the text, and the first (most specific) branch that matches at a position wins.
+# The patterns are written in lowercase and run against a lowercase copy of
+# the text, so the engine does no case folding per character.
+_ACTION_RE = _compile_action_pattern(_alternation(_BRANCH_PATTERNS), _alternation(_RE2_BRANCH_PATTERNS))
+
+# The mention and name branches alone, to find the assignee inside a task-list match
+_ASSIGNEE_RE = _compile_action_pattern(_alternation(_BRANCH_PATTERNS[:2]), _alternation(_RE2_BRANCH_PATTERNS[:2]))
+
+# Group numbers, since RE2 match objects only take indices for start()/end()
+_GROUP = _ACTION_RE.groupindex
+_ASSIGNEE_GROUP = _ASSIGNEE_RE.groupindex
+
+# Lone surrogates (malformed input) can't be encoded to the UTF-8 RE2 matches on
+_SURROGATE_RE = re.compile('[\ud800-\udfff]')
+
+
+def _scan_copy(text: str) -> str:
+    """
+    Return the lowercase copy of text the patterns run on.
+    
+    It has the same length as text, so match offsets index the original,
+    which keeps names' case: the few characters that lowercase to several
+    ("İ") are left as they are.
+    """
+    low = text.lower()
+    if len(low) != len(text):
+        low = "".join(lower if len(lower := char.lower()) == 1 else char for char in text)
+    if RE2_AVAILABLE and not low.isascii():
+        low = _SURROGATE_RE.sub("\ufffd", low)
+    return low
+
+
+def _compile_hyperscan_db(patterns: List[str]):
+    """
+    Compile the action patterns into one Hyperscan database, or None if
+    Hyperscan isn't installed or can't compile them.
+    
+    Hyperscan has no capture groups, so named groups become plain ones; it
+    only locates where matches start and end.
+    """
+    if not HYPERSCAN_AVAILABLE:
+        return None
+    
+    flags = hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_SOM_LEFTMOST
+    db = hyperscan.Database()
+    try:
+        db.compile(
+            expressions=[re.sub(r'\(\?P<\w+>', '(', p).encode() for p in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=[flags] * len(patterns)
+        )
+    except hyperscan.HyperscanError:
+        return None
+    return db
+
+
+# Only worth it in front of the backtracking `re` engine: RE2 already scans
+# in linear time, and Hyperscan's per-match callbacks would just add overhead.
+# Hyperscan is an optional install for setups without google-re2.
+_ACTION_HS_DB = (_compile_hyperscan_db(list(_BRANCH_PATTERNS))
+                 if isinstance(_ACTION_RE, re.Pattern) else None)
+
+# Hyperscan scratch space can't be shared by concurrent scans
+_hs_local = threading.local()
+
+
+def _hyperscan_spans(text: str) -> List[Tuple[int, int]]:
+    """
+    Return the disjoint text spans that contain every action match.
+    
+    Each Hyperscan report covers [leftmost start, end] of the matches ending
+    at that offset, so the merged reports contain every match whole; running
+    _ACTION_RE over just these spans gives the same result as the full text.
+    Offsets are byte offsets, so this is only valid for ASCII text.
+    """
+    scratch = getattr(_hs_local, "scratch", None)
+    if scratch is None:
+        scratch = _hs_local.scratch = hyperscan.Scratch(_ACTION_HS_DB)
+    
+    reports = []
+    _ACTION_HS_DB.scan(
+        text.encode("ascii"),
+        match_event_handler=lambda _id, start, end, _flags, _context: reports.append((start, end)),
+        scratch=scratch
+    )
+    
+    spans = []
+    for start, end in sorted(reports):
+        if spans and start <= spans[-1][1]:
+            spans[-1][1] = max(spans[-1][1], end)
+        else:
+            spans.append([start, end])
+    return [(start, end) for start, end in spans]
+
+
+# Markdown code fences LLMs sometimes wrap their JSON in
+_MD_JSON_RE = re.compile(r'```(?:json)?\n?')
+
+
+# RE2 releases the GIL while matching, so large notes are split into
+# line-aligned chunks scanned on several cores. The stdlib engine holds the
+# GIL and gains nothing from threads.
+_PARALLEL_WORKERS = os.cpu_count() or 1
+_PARALLEL_MIN_CHARS = 64 * 1024
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _scan_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_PARALLEL_WORKERS, thread_name_prefix="action-scan")
+        return _executor
+
+
+def _line_chunks(text: str, count: int) -> List[Tuple[int, int]]:
+    """Split text into about `count` spans that each end after a line break."""
+    size = len(text) // count + 1
+    spans = []
+    start = 0
+    while start < len(text):
+        end = text.find("\n", start + size)
+        end = len(text) if end < 0 else end + 1
+        spans.append((start, end))
+        start = end
+    return spans
+
+
+def _scan_chunk(chunk: str) -> list:
+    return list(_ACTION_RE.finditer(chunk))
+
+
+def _action_matches(low: str) -> Iterator[Tuple[int, object]]:
+    """
+    Yield (offset, match) for each action match in low, the scan copy of the
+    notes, in order. Matches may come from a slice, so their positions are
+    relative to offset.
+    """
+    # With Hyperscan, the backtracking matcher only runs over the regions
+    # Hyperscan's SIMD scan found matches in
+    if _ACTION_HS_DB is not None and low.isascii():
+        for start, end in _hyperscan_spans(low):
+            for match in _ACTION_RE.finditer(low, start, end):
+                yield 0, match
+        return
+    
+    if isinstance(_ACTION_RE, re.Pattern) or _PARALLEL_WORKERS < 2 or len(low) < _PARALLEL_MIN_CHARS:
+        spans = [(0, len(low))]
+    else:
+        spans = _line_chunks(low, _PARALLEL_WORKERS)
+    
+    if len(spans) == 1:
+        results = [_scan_chunk(low)]
+    else:
+        # RE2 encodes its whole input on every call, so pass slices, not pos/endpos
+        results = list(_scan_executor().map(_scan_chunk, (low[start:end] for start, end in spans)))
+    
+    for (start, _end), matches in zip(spans, results):
+        for match in matches:
+            yield start, match
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
 def extract_with_regex(text: str) -> List[Dict]:
     """Extract action items using regex patterns."""
     actions = []
     
-    # Pattern for @mentions with tasks
-    mention_pattern = r'@(\w+)\s+(?:to|will|should)\s+(.+?)(?:by|before|until|due)\s+(\w+\s*\d*,?\s*\d*|today|tomorrow|next\s+\w+|Friday|Monday|etc\.?)'
+    # Every pattern ends in a deadline keyword; without one there is nothing
+    # to match, and a substring search is far cheaper than the regex scan
+    low = _scan_copy(text)
+    if not any(keyword in low for keyword in _DUE_KEYWORDS):
+        return actions
     
-    # Pattern for names followed by tasks
-    name_pattern = r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+(?:will|should|to)\s+(.+?)(?:by|before|until|due)\s+(\w+\s*\d*,?\s*\d*|today|tomorrow|next\s+\w+|Friday|Monday|etc\.?)'
+    seen = {}
+    # Urgency keywords come out of the same scan as the actions. One after an
+    # action marks that action; one before any (e.g. "URGENT: ...") is held
+    # for the next action on its line.
+    last_action, last_line = None, -2
+    urgent_line = -2
     
-    # Pattern for simple task lists
-    task_pattern = r'[-•*]\s*(.+?)(?:by|before|until|due)\s+(\w+\s*\d*,?\s*\d*|today|tomorrow|next\s+\w+|Friday|Monday|etc\.?)'
-    
-    for pattern in [mention_pattern, name_pattern, task_pattern]:
-        matches = re.finditer(pattern, text, re.IGNORECASE | re.MULTILINE)
-        for match in matches:
-            if len(match.groups()) >= 3:
-                assignee = match.group(1) if match.group(1) else "Unassigned"
-                task = match.group(2).strip()
-                due_date = match.group(3).strip()
-            elif len(match.groups()) == 2:
-                assignee = "Unassigned"
-                task = match.group(1).strip()
-                due_date = match.group(2).strip()
-            else:
+    for offset, match in _action_matches(low):
+        start, end = offset + match.start(), offset + match.end()
+        line = text.rfind("\n", 0, start)
+        if match.group("urgent") is not None:
+            if _is_word_char(low[start - 1:start]) or _is_word_char(low[end:end + 1]):
                 continue
-                
-            actions.append({
+            if line == last_line:
+                last_action["priority"] = _URGENT_PRIORITY
+            else:
+                urgent_line = line
+            continue
+        
+        index = _GROUP
+        if match.group("t_task") is not None:
+            # The bullet branch claims the line from its "-", so a mention
+            # behind other text ("- [ ] @john will ...") is looked for inside it
+            task_start = offset + match.start(_GROUP["t_task"])
+            inner = _ASSIGNEE_RE.search(low[task_start:end])
+            if inner is not None:
+                match, offset, index = inner, task_start, _ASSIGNEE_GROUP
+        
+        if match.group("m_task") is not None:
+            groups = ("m_user", "m_task", "m_date")
+        elif match.group("n_task") is not None:
+            groups = ("n_name", "n_task", "n_date")
+        else:
+            groups = (None, "t_task", "t_date")
+        # Offsets line up with the original text, which keeps names' case
+        assignee, task, due_date = (
+            text[offset + match.start(index[g]):offset + match.end(index[g])] if g else "Unassigned"
+            for g in groups
+        )
+        task, due_date = task.strip(), due_date.strip()
+        
+        # Matches never overlap (one scan, first branch wins), but the same
+        # action is often repeated, e.g. in a recap at the end of the notes;
+        # a repeat only adds its urgency to the action already listed
+        key = (assignee.lower(), task.lower(), due_date.lower())
+        action = seen.get(key)
+        if action is None:
+            action = seen[key] = {
                 "assignee": assignee,
                 "task": task,
                 "due_date": due_date,
-                "priority": "medium",
+                "priority": _DEFAULT_PRIORITY,
                 "context": "extracted from meeting notes"
-            })
+            }
+            actions.append(action)
+        
+        # A keyword inside the match was consumed by the action branch
+        if line == urgent_line or _URGENT_RE.search(text, start, end) is not None:
+            action["priority"] = _URGENT_PRIORITY
+        last_action, last_line = action, line
     
     return actions
 
 
-def extract_with_openai(text: str, api_key: Optional[str] = None) -> List[Dict]:
-    """Extract action items using OpenAI API."""
-    if not OPENAI_AVAILABLE:
-        raise ImportError("openai package not installed. Install with: pip install openai")
-    
-    api_key = api_key or os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        raise ValueError("OPENAI_API_KEY not found in environment or provided")
-    
-    client = OpenAI(api_key=api_key)
-    
-    prompt = f"""Extract action items from the following meeting notes. Return a JSON array of objects with:
-- assignee: person responsible (extract @mentions, names, or "Unassigned")
+_ACTION_FIELDS = """- assignee: person responsible (extract @mentions, names, or "Unassigned")
 - task: the action item description
 - due_date: deadline if mentioned (or "Not specified")
 - priority: "high", "medium", or "low" based on urgency
-- context: brief context if available
+- context: brief context if available"""
+
+LLM_PROMPT = """Extract action items from the following meeting notes. Return a JSON array of objects with:
+""" + _ACTION_FIELDS + """
 
 Meeting notes:
 {text}
 
 Return ONLY valid JSON array, no markdown formatting."""
 
+# One request for several notes, so the instructions are paid for once per batch
+BATCH_LLM_PROMPT = """Extract action items from each of the following {count} meeting notes. Return a JSON array with exactly {count} elements, where element i is the JSON array of action items for meeting notes [i]. Each action item is an object with:
+""" + _ACTION_FIELDS + """
+
+{notes}
+
+Return ONLY valid JSON array, no markdown formatting."""
+
+# A small quantized instruct model is plenty for structured extraction and
+# generates several times faster than a 7B one; override with OLLAMA_MODEL
+OLLAMA_DEFAULT_MODEL = "qwen2.5:1.5b-instruct-q4_K_M"
+OLLAMA_NUM_PREDICT = 1024
+
+
+def _env_positive_int(name: str, default: int) -> int:
+    """Read a positive integer setting; a missing or invalid value gives the default."""
+    try:
+        return max(1, int(os.getenv(name, default)))
+    except ValueError:
+        print(f"Ignoring invalid {name}={os.getenv(name)!r}, using {default}")
+        return default
+
+
+# Parallel request slots of the Ollama server (its own OLLAMA_NUM_PARALLEL)
+OLLAMA_NUM_PARALLEL = _env_positive_int("OLLAMA_NUM_PARALLEL", 4)
+
+OPENAI_SYSTEM_PROMPT = "You are a helpful assistant that extracts action items from meeting notes. Always return valid JSON."
+
+
+def _parse_llm_actions(result: str) -> List[Dict]:
+    """Parse the JSON array returned by an LLM provider."""
+    # Remove markdown code blocks if present
+    result = _MD_JSON_RE.sub('', result)
+    
+    actions = json_loads(result)
+    return actions if isinstance(actions, list) else [actions]
+
+
+def _parse_llm_batch(result: str, count: int) -> List[List[Dict]]:
+    """Parse a batched LLM response into one action list per input note."""
+    batch = json_loads(_MD_JSON_RE.sub('', result))
+    if isinstance(batch, dict):
+        keys = [str(i) for i in range(1, count + 1)]
+        if all(key in batch for key in keys):
+            # Some models (and Ollama's JSON mode) answer with an index-keyed object
+            batch = [batch[key] for key in keys]
+        elif len(batch) == 1 and isinstance(next(iter(batch.values())), list):
+            # ... or wrap the array, e.g. {"results": [...]}
+            batch = next(iter(batch.values()))
+    if not isinstance(batch, list) or len(batch) != count:
+        raise ValueError(f"expected a JSON array of {count} results")
+    return [actions if isinstance(actions, list) else [actions] for actions in batch]
+
+
+def _batch_prompt(texts: List[str]) -> str:
+    notes = "\n".join(f"[{i}]\n{text}" for i, text in enumerate(texts, 1))
+    return BATCH_LLM_PROMPT.format(count=len(texts), notes=notes)
+
+
+def _openai_messages(prompt: str) -> List[Dict]:
+    return [
+        {"role": "system", "content": OPENAI_SYSTEM_PROMPT},
+        {"role": "user", "content": prompt}
+    ]
+
+
+def _ollama_payload(prompt: str, model: str) -> Dict:
+    return {
+        "model": model,
+        "prompt": prompt,
+        "stream": False,
+        "format": "json",
+        "options": {
+            "temperature": 0.1,
+            # Output length is the main latency knob; one note's action list
+            # rarely needs more than a few hundred tokens
+            "num_predict": OLLAMA_NUM_PREDICT
+        }
+    }
+
+
+def _openai_api_key(api_key: Optional[str]) -> str:
+    if not OPENAI_AVAILABLE:
+        raise ImportError("openai package not installed. Install with: pip install openai")
+    
+    api_key = api_key or os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise ValueError("OPENAI_API_KEY not found in environment or provided")
+    return api_key
+
+
+class ProviderError(Exception):
+    """An LLM provider request failed or returned output that couldn't be parsed."""
+
+
+def _regex_fallback(text: str, error) -> List[Dict]:
+    print(f"Error with {error}")
+    print("Falling back to regex extraction...")
+    return extract_with_regex(text)
+
+
+# Clients are reused across calls so keep-alive connections (and their TLS
+# sessions) survive between requests instead of being rebuilt every time
+_OPENAI_CLIENTS: Dict[str, "OpenAI"] = {}
+
+if REQUESTS_AVAILABLE:
+    _OLLAMA_SESSION = requests.Session()
+    _OLLAMA_SESSION.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=64))
+    _OLLAMA_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=64))
+
+
+def _openai_client(api_key: Optional[str]) -> "OpenAI":
+    api_key = _openai_api_key(api_key)
+    client = _OPENAI_CLIENTS.get(api_key)
+    if client is None:
+        client = _OPENAI_CLIENTS.setdefault(api_key, OpenAI(api_key=api_key))
+    return client
+
+
+def extract_with_openai(text: str, api_key: Optional[str] = None, fallback: bool = True) -> List[Dict]:
+    """
+    Extract action items using OpenAI API.
+    
+    If the request fails, falls back to regex extraction, or raises
+    ProviderError when fallback is False.
+    """
+    client = _openai_client(api_key)
+    
     try:
         response = client.chat.completions.create(
             model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": "You are a helpful assistant that extracts action items from meeting notes. Always return valid JSON."},
-                {"role": "user", "content": prompt}
-            ],
+            messages=_openai_messages(LLM_PROMPT.format(text=text)),
             temperature=0.3
         )
         
-        result = response.choices[0].message.content.strip()
-        # Remove markdown code blocks if present
-        result = re.sub(r'```json\n?', '', result)
-        result = re.sub(r'```\n?', '', result)
-        
-        actions = json.loads(result)
-        return actions if isinstance(actions, list) else [actions]
+        return _parse_llm_actions(response.choices[0].message.content.strip())
     except Exception as e:
-        print(f"Error with OpenAI API: {e}")
-        print("Falling back to regex extraction...")
-        return extract_with_regex(text)
+        if not fallback:
+            raise ProviderError(f"OpenAI API: {e}") from e
+        return _regex_fallback(text, f"OpenAI API: {e}")
 
 
-def extract_with_ollama(text: str, base_url: str = "http://localhost:11434", model: str = "llama2") -> List[Dict]:
-    """Extract action items using Ollama (local LLM)."""
+def extract_with_ollama(text: str, base_url: str = "http://localhost:11434", model: str = OLLAMA_DEFAULT_MODEL,
+                        fallback: bool = True) -> List[Dict]:
+    """
+    Extract action items using Ollama (local LLM).
+    
+    If the request fails, falls back to regex extraction, or raises
+    ProviderError when fallback is False.
+    """
     if not REQUESTS_AVAILABLE:
         raise ImportError("requests package not installed. Install with: pip install requests")
     
-    prompt = f"""Extract action items from the following meeting notes. Return a JSON array of objects with:
-- assignee: person responsible (extract @mentions, names, or "Unassigned")
-- task: the action item description
-- due_date: deadline if mentioned (or "Not specified")
-- priority: "high", "medium", or "low" based on urgency
-- context: brief context if available
-
-Meeting notes:
-{text}
-
-Return ONLY valid JSON array, no markdown formatting."""
-
     try:
-        response = requests.post(
+        response = _OLLAMA_SESSION.post(
             f"{base_url}/api/generate",
-            json={
-                "model": model,
-                "prompt": prompt,
-                "stream": False,
-                "format": "json"
-            },
+            json=_ollama_payload(LLM_PROMPT.format(text=text), model),
             timeout=60
         )
         response.raise_for_status()
         
-        result = response.json().get("response", "")
-        # Remove markdown code blocks if present
-        result = re.sub(r'```json\n?', '', result)
-        result = re.sub(r'```\n?', '', result)
+        return _parse_llm_actions(response.json().get("response", ""))
+    except Exception as e:
+        if not fallback:
+            raise ProviderError(f"Ollama API: {e}") from e
+        return _regex_fallback(text, f"Ollama API: {e}")
+
+
+class _JSONArrayStream:
+    """
+    Incremental parser for a JSON array arriving in chunks.
+    
+    feed() returns the array elements completed by the new chunk. Anything
+    before the opening bracket (e.g. a markdown fence) is skipped. If the
+    document turns out not to be an array, nothing is returned incrementally
+    and the caller falls back to parsing the whole of `text`. `closed` is
+    set once the closing bracket has been read.
+    """
+    
+    def __init__(self):
+        self.text = ""
+        self.is_array = None
+        self.closed = False
+        self._pos = 0
+        self._decoder = json.JSONDecoder()
+    
+    def feed(self, chunk: str, final: bool = False) -> List:
+        self.text += chunk
+        if self.is_array is None:
+            starts = [i for i in (self.text.find("["), self.text.find("{")) if i >= 0]
+            if not starts:
+                return []
+            start = min(starts)
+            self.is_array = self.text[start] == "["
+            self._pos = start + 1
+        if not self.is_array:
+            return []
+        
+        items = []
+        while True:
+            pos = self._skip(self._pos, ",")
+            if pos >= len(self.text):
+                break
+            if self.text[pos] == "]":
+                self.closed = True
+                break
+            try:
+                item, end = self._decoder.raw_decode(self.text, pos)
+            except json.JSONDecodeError:
+                break
+            # A trailing number or literal may still be growing; wait for its delimiter
+            if not final and self._skip(end, "") >= len(self.text):
+                break
+            items.append(item)
+            self._pos = end
+        return items
+    
+    def finish(self) -> List:
+        """Return the elements still pending once the input has ended."""
+        return self.feed("", final=True)
+    
+    def _skip(self, pos: int, extra: str) -> int:
+        while pos < len(self.text) and (self.text[pos].isspace() or self.text[pos] in extra):
+            pos += 1
+        return pos
+
+
+def stream_with_ollama(text: str, base_url: str = "http://localhost:11434",
+                       model: str = OLLAMA_DEFAULT_MODEL, fallback: bool = True) -> Iterator[Dict]:
+    """
+    Extract action items using Ollama, yielding each one as soon as the model
+    has finished generating it instead of waiting for the whole response.
+    
+    Falls back to regex extraction if the request fails, or its response
+    can't be parsed, before any item has been produced. When fallback is
+    False, raises ProviderError instead, also after a partial response.
+    """
+    if not REQUESTS_AVAILABLE:
+        raise ImportError("requests package not installed. Install with: pip install requests")
+    
+    payload = _ollama_payload(LLM_PROMPT.format(text=text), model)
+    payload["stream"] = True
+    parser = _JSONArrayStream()
+    yielded = 0
+    
+    try:
+        with _OLLAMA_SESSION.post(f"{base_url}/api/generate", json=payload, stream=True, timeout=60) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = json_loads(line)
+                if chunk.get("error"):
+                    raise RuntimeError(chunk["error"])
+                for action in parser.feed(chunk.get("response", "")):
+                    yielded += 1
+                    yield action
+                if chunk.get("done"):
+                    break
         
-        actions = json.loads(result)
-        return actions if isinstance(actions, list) else [actions]
+        if not parser.is_array:
+            # Not a JSON array (e.g. a single object); parse what we received as a whole
+            for action in _parse_llm_actions(parser.text):
+                yielded += 1
+                yield action
+        else:
+            for action in parser.finish():
+                yielded += 1
+                yield action
+            if not parser.closed:
+                # Cut off by num_predict, or malformed past the last good element
+                raise ValueError("response ended inside the JSON array")
     except Exception as e:
-        print(f"Error with Ollama API: {e}")
-        print("Falling back to regex extraction...")
-        return extract_with_regex(text)
+        if not fallback:
+            raise ProviderError(f"Ollama API: {e}") from e
+        if yielded:
+            print(f"Error with Ollama API after {yielded} action items: {e}")
+            return
+        yield from _regex_fallback(text, f"Ollama API: {e}")
+
+
+async def extract_with_openai_async(text: str, api_key: Optional[str] = None, fallback: bool = True,
+                                    client: Optional["AsyncOpenAI"] = None) -> List[Dict]:
+    """
+    Async variant of extract_with_openai; the request is awaited, not blocking a thread.
+    
+    Pass a shared AsyncOpenAI client to reuse its connections across calls made
+    on the same event loop; otherwise a client is opened for this call only.
+    """
+    if client is None:
+        api_key = _openai_api_key(api_key)
+    
+    try:
+        params = dict(
+            model="gpt-3.5-turbo",
+            messages=_openai_messages(LLM_PROMPT.format(text=text)),
+            temperature=0.3
+        )
+        if client is None:
+            async with AsyncOpenAI(api_key=api_key) as own_client:
+                response = await own_client.chat.completions.create(**params)
+        else:
+            response = await client.chat.completions.create(**params)
+        
+        return _parse_llm_actions(response.choices[0].message.content.strip())
+    except Exception as e:
+        if not fallback:
+            raise ProviderError(f"OpenAI API: {e}") from e
+        return _regex_fallback(text, f"OpenAI API: {e}")
+
+
+async def extract_with_ollama_async(text: str, base_url: str = "http://localhost:11434",
+                                    model: str = OLLAMA_DEFAULT_MODEL, fallback: bool = True,
+                                    client: Optional["httpx.AsyncClient"] = None) -> List[Dict]:
+    """
+    Async variant of extract_with_ollama.
+    
+    Pass a shared httpx.AsyncClient to reuse its connections across calls made
+    on the same event loop; otherwise a client is opened for this call only.
+    """
+    if not HTTPX_AVAILABLE:
+        raise ImportError("httpx package not installed. Install with: pip install httpx")
+    
+    payload = _ollama_payload(LLM_PROMPT.format(text=text), model)
+    
+    try:
+        if client is None:
+            async with httpx.AsyncClient(timeout=60) as own_client:
+                response = await own_client.post(f"{base_url}/api/generate", json=payload)
+        else:
+            response = await client.post(f"{base_url}/api/generate", json=payload, timeout=60)
+        response.raise_for_status()
+        
+        return _parse_llm_actions(response.json().get("response", ""))
+    except Exception as e:
+        if not fallback:
+            raise ProviderError(f"Ollama API: {e}") from e
+        return _regex_fallback(text, f"Ollama API: {e}")
+
+
+# Recent results keyed by (provider, notes digest, options), most recent last.
+# Values are JSON strings so every hit hands the caller a fresh copy.
+_RESULT_CACHE_SIZE = 256
+_RESULT_CACHE_MAX_TEXT = 100_000
+_RESULT_CACHE: "OrderedDict[tuple, bytes]" = OrderedDict()
+_RESULT_CACHE_LOCK = threading.Lock()
+
+
+def _result_cache_key(text: str, provider: str, kwargs: Dict) -> Optional[tuple]:
+    if len(text) > _RESULT_CACHE_MAX_TEXT:
+        return None
+    notes_hash = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+    # Credentials and shared clients don't change the result
+    options = tuple(sorted((k, v) for k, v in kwargs.items() if k not in ("api_key", "client")))
+    try:
+        hash(options)
+    except TypeError:
+        # An option like a list can't be part of a key; skip the cache
+        return None
+    return provider, notes_hash, options
+
+
+def _result_cache_get(key: Optional[tuple]) -> Optional[List[Dict]]:
+    if key is None:
+        return None
+    with _RESULT_CACHE_LOCK:
+        cached = _RESULT_CACHE.get(key)
+        if cached is None:
+            return None
+        _RESULT_CACHE.move_to_end(key)
+    return json_loads(cached)
+
+
+def _result_cache_put(key: Optional[tuple], actions: List[Dict]):
+    if key is None:
+        return
+    serialized = json_dumps(actions)
+    with _RESULT_CACHE_LOCK:
+        _RESULT_CACHE[key] = serialized
+        _RESULT_CACHE.move_to_end(key)
+        while len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+            _RESULT_CACHE.popitem(last=False)
 
 
 def extract_action_items(text: str, provider: str = "regex", **kwargs) -> List[Dict]:
     """
     Extract action items from meeting notes.
     
+    Results for the last 256 distinct (notes, provider, options) combinations
+    are cached, so re-submitting the same notes skips the LLM call. Regex
+    fallbacks after a provider error are not cached.
+    
     Args:
         text: Meeting notes text
         provider: "regex", "openai", or "ollama"
@@ -173,15 +828,191 @@ def extract_action_items(text: str, provider: str = "regex", **kwargs) -> List[D
         List of action item dictionaries
     """
     if provider == "openai":
-        return extract_with_openai(text, kwargs.get("api_key"))
-    elif provider == "ollama":
-        return extract_with_ollama(
+        # A cached result must not hide a missing API key
+        _openai_api_key(kwargs.get("api_key"))
+    
+    key = _result_cache_key(text, provider, kwargs)
+    cached = _result_cache_get(key)
+    if cached is not None:
+        return cached
+    
+    try:
+        if provider == "openai":
+            actions = extract_with_openai(text, kwargs.get("api_key"), fallback=False)
+        elif provider == "ollama":
+            actions = extract_with_ollama(
+                text,
+                kwargs.get("base_url", "http://localhost:11434"),
+                kwargs.get("model", OLLAMA_DEFAULT_MODEL),
+                fallback=False
+            )
+        else:
+            actions = extract_with_regex(text)
+    except ProviderError as e:
+        return _regex_fallback(text, e)
+    
+    _result_cache_put(key, actions)
+    return actions
+
+
+def stream_action_items(text: str, provider: str = "regex", **kwargs) -> Iterator[Dict]:
+    """
+    Streaming variant of extract_action_items, yielding action items as the
+    provider produces them. Only Ollama streams; other providers yield their
+    complete result.
+    
+    Shares extract_action_items' result cache. A stream is cached only if it
+    completed without a provider error.
+    """
+    if provider != "ollama":
+        yield from extract_action_items(text, provider, **kwargs)
+        return
+    
+    key = _result_cache_key(text, provider, kwargs)
+    cached = _result_cache_get(key)
+    if cached is not None:
+        yield from cached
+        return
+    
+    actions = []
+    try:
+        for action in stream_with_ollama(
             text,
             kwargs.get("base_url", "http://localhost:11434"),
-            kwargs.get("model", "llama2")
+            kwargs.get("model", OLLAMA_DEFAULT_MODEL),
+            fallback=False
+        ):
+            actions.append(action)
+            yield action
+    except ProviderError as e:
+        if actions:
+            print(f"Error with {e} after {len(actions)} action items")
+            return
+        yield from _regex_fallback(text, e)
+        return
+    
+    _result_cache_put(key, actions)
+
+
+def _extract_batch_with_openai(texts: List[str], api_key: Optional[str] = None) -> List[List[Dict]]:
+    client = _openai_client(api_key)
+    
+    try:
+        response = client.chat.completions.create(
+            model="gpt-3.5-turbo",
+            messages=_openai_messages(_batch_prompt(texts)),
+            temperature=0.3
+        )
+        
+        return _parse_llm_batch(response.choices[0].message.content.strip(), len(texts))
+    except Exception as e:
+        print(f"Error with batched OpenAI request: {e}")
+        print("Falling back to one request per note...")
+        return [extract_with_openai(text, api_key) for text in texts]
+
+
+async def _extract_batch_with_ollama_async(texts: List[str], base_url: str, model: str) -> List[List[Dict]]:
+    # Ollama serves OLLAMA_NUM_PARALLEL requests at once; more would only queue
+    # on the server (and run into the client timeout there)
+    semaphore = asyncio.Semaphore(OLLAMA_NUM_PARALLEL)
+    
+    async with httpx.AsyncClient(timeout=60) as client:
+        async def extract(text: str) -> List[Dict]:
+            async with semaphore:
+                return await extract_with_ollama_async(text, base_url, model, client=client)
+        
+        return list(await asyncio.gather(*(extract(text) for text in texts)))
+
+
+def _extract_batch_with_ollama(texts: List[str], base_url: str, model: str) -> List[List[Dict]]:
+    if not HTTPX_AVAILABLE:
+        return [extract_with_ollama(text, base_url, model) for text in texts]
+    return asyncio.run(_extract_batch_with_ollama_async(texts, base_url, model))
+
+
+def extract_action_items_batch(texts: List[str], provider: str = "regex", batch_size: int = 6,
+                               **kwargs) -> List[List[Dict]]:
+    """
+    Extract action items from several meeting notes.
+    
+    OpenAI gets up to batch_size notes per request, numbered in a single
+    prompt, so the instructions and round trip are shared across the batch.
+    A batch whose response can't be split back per note is retried note by note.
+    
+    Ollama gets one request per note, OLLAMA_NUM_PARALLEL of them in flight at
+    once, so a server started with that many parallel slots generates them
+    side by side.
+    
+    Args:
+        texts: Meeting notes, one string per meeting
+        provider: "regex", "openai", or "ollama"
+        batch_size: Maximum number of notes per LLM request
+        **kwargs: Additional arguments for specific providers
+    
+    Returns:
+        One list of action item dictionaries per input text, in order
+    """
+    if provider == "ollama":
+        return _extract_batch_with_ollama(
+            texts,
+            kwargs.get("base_url", "http://localhost:11434"),
+            kwargs.get("model", OLLAMA_DEFAULT_MODEL)
         )
-    else:
-        return extract_with_regex(text)
+    elif provider != "openai":
+        return [extract_with_regex(text) for text in texts]
+    
+    batch_size = max(batch_size, 1)
+    results = []
+    for start in range(0, len(texts), batch_size):
+        chunk = texts[start:start + batch_size]
+        if len(chunk) == 1:
+            results.append(extract_action_items(chunk[0], provider, **kwargs))
+        else:
+            results.extend(_extract_batch_with_openai(chunk, kwargs.get("api_key")))
+    return results
+
+
+async def extract_action_items_async(text: str, provider: str = "regex", **kwargs) -> List[Dict]:
+    """
+    Async variant of extract_action_items for callers running an event loop.
+    
+    LLM providers are awaited so concurrent extractions overlap their network
+    I/O; the regex provider is CPU-only and runs inline. Pass client= (an
+    AsyncOpenAI or httpx.AsyncClient) to reuse connections across calls.
+    Shares extract_action_items' result cache.
+    """
+    if provider == "openai" and kwargs.get("client") is None:
+        # A cached result must not hide a missing API key
+        _openai_api_key(kwargs.get("api_key"))
+    
+    key = _result_cache_key(text, provider, kwargs)
+    cached = _result_cache_get(key)
+    if cached is not None:
+        return cached
+    
+    try:
+        if provider == "openai":
+            actions = await extract_with_openai_async(
+                text,
+                kwargs.get("api_key"),
+                fallback=False,
+                client=kwargs.get("client")
+            )
+        elif provider == "ollama":
+            actions = await extract_with_ollama_async(
+                text,
+                kwargs.get("base_url", "http://localhost:11434"),
+                kwargs.get("model", OLLAMA_DEFAULT_MODEL),
+                fallback=False,
+                client=kwargs.get("client")
+            )
+        else:
+            actions = extract_with_regex(text)
+    except ProviderError as e:
+        return _regex_fallback(text, e)
+    
+    _result_cache_put(key, actions)
+    return actions
 
 
 def save_output(actions: List[Dict], output_path: str, format: str = "json"):
@@ -189,13 +1020,21 @@ def save_output(actions: List[Dict], output_path: str, format: str = "json"):
     output_path = Path(output_path)
     
     if format == "json":
-        with open(output_path, "w") as f:
-            json.dump(actions, f, indent=2)
+        with open(output_path, "wb") as f:
+            f.write(json_dumps(actions, indent=True))
     
     elif format == "csv":
-        import pandas as pd
-        df = pd.DataFrame(actions)
-        df.to_csv(output_path, index=False)
+        # LLM output may list bare strings rather than objects; keep them as tasks
+        rows = [action if isinstance(action, dict) else {"task": str(action)} for action in actions]
+        # Standard fields first, then any extra keys an LLM provider returned
+        fieldnames = list(dict.fromkeys(
+            ["assignee", "task", "due_date", "priority", "context"]
+            + [key for row in rows for key in row]
+        ))
+        with open(output_path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
     
     elif format == "md":
         with open(output_path, "w") as f:
@@ -219,8 +1058,8 @@ def main():
                        help="Output format (default: json)")
     parser.add_argument("--ollama-url", default="http://localhost:11434",
                        help="Ollama base URL (default: http://localhost:11434)")
-    parser.add_argument("--ollama-model", default="llama2",
-                       help="Ollama model name (default: llama2)")
+    parser.add_argument("--ollama-model", default=OLLAMA_DEFAULT_MODEL,
+                       help=f"Ollama model name (default: {OLLAMA_DEFAULT_MODEL})")
     
     args = parser.parse_args()
     
@@ -0,0 +1,19 @@
+"""
+Gunicorn settings for the web interface.
+
+    gunicorn -c gunicorn_conf.py app:app
+"""
+
+import multiprocessing
+
+bind = "127.0.0.1:5000"
+
+# Regex extraction is CPU-bound, so scale processes with the cores; the
+# threads keep a worker busy while other requests wait on OpenAI/Ollama
+workers = multiprocessing.cpu_count() * 2 + 1
+worker_class = "gthread"
+threads = 8
+
+# Reuse client connections instead of reconnecting (and leaving sockets in
+# TIME_WAIT) for every request
+keepalive = 30
@@ -0,0 +1,119 @@
+document.getElementById('extractForm').addEventListener('submit', async (e) => {
+    e.preventDefault();
+
+    const notes = document.getElementById('notes').value;
+    const provider = document.getElementById('provider').value;
+    const loading = document.getElementById('loading');
+    const error = document.getElementById('error');
+    const results = document.getElementById('results');
+
+    loading.style.display = 'block';
+    error.innerHTML = '';
+    results.innerHTML = '';
+
+    try {
+        if (provider === 'ollama') {
+            await streamResults(notes, provider);
+            return;
+        }
+
+        // Rows come back rendered and escaped; one innerHTML assignment
+        const response = await fetch('/extract_html', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ notes, provider })
+        });
+
+        if (!response.ok) {
+            const data = await response.json();
+            error.innerHTML = `<div class="error">${escapeHTML(data.error)}</div>`;
+        } else {
+            showRows(await response.text());
+        }
+    } catch (err) {
+        error.innerHTML = `<div class="error">Error: ${escapeHTML(err.message)}</div>`;
+    } finally {
+        loading.style.display = 'none';
+    }
+});
+
+// Server-sent events from /extract_stream: one "data:" event per action,
+// then "event: done" (or "event: error")
+async function streamResults(notes, provider) {
+    const response = await fetch('/extract_stream', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({ notes, provider })
+    });
+
+    if (!response.ok) {
+        const data = await response.json();
+        throw new Error(data.error);
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let tbody = null;
+    let buffer = '';
+
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+
+        let end;
+        while ((end = buffer.indexOf('\n\n')) !== -1) {
+            const message = buffer.slice(0, end);
+            buffer = buffer.slice(end + 2);
+
+            let event = 'message';
+            let data = '';
+            message.split('\n').forEach(line => {
+                if (line.startsWith('event: ')) event = line.slice(7);
+                else if (line.startsWith('data: ')) data += line.slice(6);
+            });
+
+            if (event === 'error') {
+                throw new Error(JSON.parse(data).error);
+            } else if (event === 'message') {
+                // The table is built with the first row; later rows are
+                // appended, so each one is parsed once
+                const row = renderRow(JSON.parse(data));
+                if (tbody) {
+                    tbody.insertAdjacentHTML('beforeend', row);
+                } else {
+                    showRows(row);
+                    tbody = document.querySelector('#results tbody');
+                }
+            }
+        }
+    }
+
+    if (!tbody) showRows('');
+}
+
+function escapeHTML(value) {
+    return String(value).replace(/[&<>"']/g, c => ({
+        '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'
+    })[c]);
+}
+
+function showRows(rows) {
+    document.getElementById('results').innerHTML = rows
+        ? '<h2>Extracted Action Items</h2><table><thead><tr><th>Assignee</th><th>Task</th><th>Due Date</th><th>Priority</th></tr></thead><tbody>'
+          + rows + '</tbody></table>'
+        : '<p>No action items found.</p>';
+}
+
+function renderRow(action) {
+    return `<tr>
+            <td>${escapeHTML(action.assignee || 'Unassigned')}</td>
+            <td>${escapeHTML(action.task || 'N/A')}</td>
+            <td>${escapeHTML(action.due_date || 'Not specified')}</td>
+            <td>${escapeHTML(action.priority || 'medium')}</td>
+        </tr>`;
+}